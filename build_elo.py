@@ -1,12 +1,9 @@
 import pandas as pd
 from collections import defaultdict
-import math
 
-BASE_ELO = 1500
-K = 30
+from helpers.elo import BASE_ELO, expected_score
 
-def expected_score(r_a, r_b):
-    return 1 / (1 + 10 ** ((r_b - r_a) / 400))
+K = 30
 
 def build_elo(
     input_path="data/rugby_matches.csv",
@@ -15,7 +12,7 @@ def build_elo(
     df = pd.read_csv(input_path)
     df.columns = [c.strip().lower() for c in df.columns]
 
-    df["date"] = pd.to_datetime(df["date"])
+    df["date"] = pd.to_datetime(df["date"], format="ISO8601", cache=True)
     df = df.sort_values("date").reset_index(drop=True)
 
     ratings = defaultdict(lambda: BASE_ELO)
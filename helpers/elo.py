@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from collections import defaultdict
 
@@ -33,14 +34,17 @@ def compute_elo(df):
 
     ratings = defaultdict(lambda: BASE_ELO)
 
-    elo_pre_home = []
-    elo_pre_away = []
-    elo_post_home = []
-    elo_post_away = []
-    elo_delta_home = []
-    elo_delta_away = []
-
-    for _, row in df.iterrows():
+    # Preallocate the output columns in one shot instead of growing
+    # six Python lists row by row.
+    n = len(df)
+    elo_pre_home = np.empty(n)
+    elo_pre_away = np.empty(n)
+    elo_post_home = np.empty(n)
+    elo_post_away = np.empty(n)
+    elo_delta_home = np.empty(n)
+    elo_delta_away = np.empty(n)
+
+    for i, (_, row) in enumerate(df.iterrows()):
         home = row["home_team"]
         away = row["away_team"]
 
@@ -62,12 +66,12 @@ def compute_elo(df):
         new_home = r_home + k * (s_home - e_home)
         new_away = r_away + k * (s_away - e_away)
 
-        elo_pre_home.append(r_home)
-        elo_pre_away.append(r_away)
-        elo_post_home.append(new_home)
-        elo_post_away.append(new_away)
-        elo_delta_home.append(new_home - r_home)
-        elo_delta_away.append(new_away - r_away)
+        elo_pre_home[i] = r_home
+        elo_pre_away[i] = r_away
+        elo_post_home[i] = new_home
+        elo_post_away[i] = new_away
+        elo_delta_home[i] = new_home - r_home
+        elo_delta_away[i] = new_away - r_away
 
         ratings[home] = new_home
         ratings[away] = new_away
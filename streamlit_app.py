@@ -1,261 +1,759 @@
-import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-
-# =========================================================
-# Page config
-# =========================================================
-st.set_page_config(
-    page_title="Rugby Performance Analytics Dashboard",
-    layout="wide",
-)
-
-st.title("Rugby Performance Analytics Dashboard")
-
-MIN_YEAR = 1987
-
-# =========================================================
-# Data Loading
-# =========================================================
-@st.cache_data
-def load_data(path="data/rugby_matches_with_elo.csv"):
-    df = pd.read_csv(path)
-    df.columns = [c.strip().lower() for c in df.columns]
-
-    required = {
-        "date", "year", "team", "opponent",
-        "team_score", "opponent_score",
-        "margin", "result", "tournament",
-        "dominance_score",
-        "elo_pre", "elo_post", "elo_delta",
-    }
-
-    missing = required - set(df.columns)
-    if missing:
-        raise ValueError(f"Missing columns: {missing}")
-
-    df["date"] = pd.to_datetime(df["date"])
-    df["year"] = pd.to_numeric(df["year"], errors="coerce").astype("Int64")
-
-    return df[df["year"] >= MIN_YEAR].copy()
-
-df = load_data()
-
-# =========================================================
-# Sidebar Filters
-# =========================================================
-with st.sidebar:
-    st.header("Filters")
-
-    year_range = st.slider(
-        "Year range",
-        int(df["year"].min()),
-        int(df["year"].max()),
-        (int(df["year"].min()), int(df["year"].max())),
-    )
-
-    tournaments = sorted(
-        df["tournament"]
-        .dropna()
-        .astype(str)
-        .unique()
-    )
-
-    selected_tournaments = st.multiselect(
-        "Tournaments",
-        tournaments,
-        default=[]
-    )
-
-df_filtered = df[
-    (df["year"] >= year_range[0]) &
-    (df["year"] <= year_range[1])
-].copy()
-
-if selected_tournaments:
-    df_filtered = df_filtered[
-        df_filtered["tournament"].astype(str).isin(selected_tournaments)
-    ]
-
-teams = sorted(df["team"].dropna().unique())
-
-# =========================================================
-# Shared Aggregations
-# =========================================================
-dominance_by_team = (
-    df_filtered
-    .groupby("team", as_index=False)
-    .agg(
-        dominance=("dominance_score", "sum"),
-        matches=("dominance_score", "count"),
-        avg_margin=("margin", "mean"),
-    )
-    .sort_values("dominance", ascending=False)
-)
-
-# =========================================================
-# Tabs
-# =========================================================
-tab_team, tab_rankings, tab_elo, tab_trends, tab_compare, tab_wc, tab_about = st.tabs(
-    ["Team View", "Rankings", "Elo", "Trends", "Compare", "World Cups", "About"]
-)
-
-# =========================================================
-# Team View
-# =========================================================
-with tab_team:
-    st.header("Team Performance Overview")
-
-    team = st.selectbox("Select team", teams, key="team_view")
-
-    tdf = df_filtered[df_filtered["team"] == team]
-
-    col1, col2, col3 = st.columns(3)
-
-    col1.metric("Matches", len(tdf))
-    col2.metric("Total Dominance", int(tdf["dominance_score"].sum()))
-    col3.metric("Avg Margin", round(tdf["margin"].mean(), 2))
-
-    st.subheader("Recent Matches")
-    st.dataframe(
-        tdf.sort_values("date", ascending=False).head(10),
-        use_container_width=True,
-        hide_index=True,
-    )
-
-# =========================================================
-# Rankings
-# =========================================================
-with tab_rankings:
-    st.header("Dominance Rankings")
-
-    rankings = dominance_by_team.reset_index(drop=True)
-    rankings["rank"] = rankings.index + 1
-
-    st.dataframe(
-        rankings[["rank", "team", "dominance", "matches", "avg_margin"]],
-        use_container_width=True,
-        hide_index=True,
-    )
-
-# =========================================================
-# Elo
-# =========================================================
-with tab_elo:
-    st.header("Elo Ratings")
-
-    elo_leader = (
-        df_filtered.sort_values("date")
-        .groupby("team", as_index=False)
-        .agg(
-            current_elo=("elo_post", "last"),
-            peak_elo=("elo_post", "max"),
-            matches=("elo_post", "count"),
-        )
-        .sort_values("current_elo", ascending=False)
-        .reset_index(drop=True)
-    )
-
-    elo_leader["rank"] = elo_leader.index + 1
-    elo_leader["current_elo"] = elo_leader["current_elo"].round(1)
-
-    st.subheader("Elo Leaderboard")
-    st.dataframe(
-        elo_leader[["rank", "team", "current_elo", "peak_elo", "matches"]],
-        use_container_width=True,
-        hide_index=True,
-    )
-
-    st.divider()
-
-    team = st.selectbox("Select team", teams, key="elo_team")
-
-    tdf = df[df["team"] == team].sort_values("date")
-
-    fig, ax = plt.subplots()
-    ax.plot(tdf["date"], tdf["elo_post"])
-    ax.set_title(f"{team} Elo Over Time")
-    ax.set_ylabel("Elo")
-    ax.set_xlabel("Year")
-    st.pyplot(fig, use_container_width=True)
-
-# =========================================================
-# Trends
-# =========================================================
-with tab_trends:
-    st.header("Dominance Over Time")
-
-    trend_df = (
-        df_filtered
-        .groupby(["year", "team"], as_index=False)
-        .agg(dominance=("dominance_score", "sum"))
-    )
-
-    team = st.selectbox("Select team", teams, key="trend_team")
-
-    tdf = trend_df[trend_df["team"] == team]
-
-    fig, ax = plt.subplots()
-    ax.plot(tdf["year"], tdf["dominance"])
-    ax.set_title(f"{team} — Annual Dominance")
-    ax.set_ylabel("Dominance")
-    ax.set_xlabel("Year")
-    st.pyplot(fig, use_container_width=True)
-
-# =========================================================
-# Compare
-# =========================================================
-with tab_compare:
-    st.header("Team Comparison")
-
-    selected = st.multiselect(
-        "Select exactly two teams",
-        teams,
-        default=teams[:2],
-        max_selections=2,
-    )
-
-    if len(selected) == 2:
-        comp = dominance_by_team[
-            dominance_by_team["team"].isin(selected)
-        ]
-        st.dataframe(comp, use_container_width=True, hide_index=True)
-    else:
-        st.info("Select two teams to compare.")
-
-
-# =========================================================
-# World Cups
-# =========================================================
-with tab_wc:
-    st.header("World Cups")
-
-    st.markdown(
-        """
-This tab will later include:
-- World Cup–only dominance
-- Tournament-weighted Elo
-- Era comparisons
-"""
-    )
-
-# =========================================================
-# About
-# =========================================================
-with tab_about:
-    st.header("About This Project")
-
-    st.markdown(
-        """
-**Rugby Performance Analytics Dashboard**
-
-- Match-level dataset (1987+)
-- Dominance Index v1
-- Elo ratings (explanatory)
-- Tier 1 & 2 nations
-
-Built for clarity, not prediction.
-"""
-    )
-
+import streamlit as st
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from typing import NamedTuple
+
+# =========================================================
+# Page config
+# =========================================================
+st.set_page_config(
+    page_title="Rugby Performance Analytics Dashboard",
+    layout="wide",
+)
+
+st.title("Rugby Performance Analytics Dashboard")
+
+MIN_YEAR = 1987
+
+# Static data stays as plain tuples at import; the DataFrame is only
+# built (and cached) when the World Cups tab actually renders.
+WORLD_CUP_COLUMNS = ("year", "host", "winner", "runner_up")
+WORLD_CUPS = (
+    (1987, "New Zealand / Australia", "New Zealand", "France"),
+    (1991, "England", "Australia", "England"),
+    (1995, "South Africa", "South Africa", "New Zealand"),
+    (1999, "Wales", "Australia", "France"),
+    (2003, "Australia", "England", "Australia"),
+    (2007, "France", "South Africa", "England"),
+    (2011, "New Zealand", "New Zealand", "France"),
+    (2015, "England", "New Zealand", "Australia"),
+    (2019, "Japan", "South Africa", "England"),
+    (2023, "France", "South Africa", "New Zealand"),
+)
+
+# =========================================================
+# Data Loading
+# =========================================================
+REQUIRED_COLUMNS = {
+    "date", "year", "team", "opponent",
+    "team_score", "opponent_score",
+    "margin", "result", "tournament",
+    "dominance_score",
+    "elo_pre", "elo_post", "elo_delta",
+}
+
+
+# Explicit dtypes skip the parser's two-pass type inference and land
+# each column in its final width straight away.
+CSV_DTYPES = {
+    "team": "category",
+    "opponent": "category",
+    "tournament": "category",
+    "team_score": "int16",
+    "opponent_score": "int16",
+    "margin": "int16",
+    "year": "int16",
+    "elo_pre": "float32",
+    "elo_post": "float32",
+    "elo_delta": "float32",
+    "dominance_score": "float32",
+}
+
+
+@st.cache_data(persist="disk", show_spinner=False)
+def load_data(path="data/rugby_matches_with_elo.csv"):
+    # Parquet snapshot of the fully-prepared frame: a cold start reads
+    # the columnar file (dtypes included) instead of re-parsing the CSV
+    # and redoing every cast below. Ignored when the CSV is newer or
+    # no parquet engine is installed.
+    csv_path = Path(path)
+    snapshot = csv_path.parent / ".cache.parquet"
+    try:
+        if snapshot.stat().st_mtime > csv_path.stat().st_mtime:
+            return pd.read_parquet(snapshot)
+    except (ImportError, OSError):
+        pass
+
+    def read_csv(**kwargs):
+        # pyarrow parses in parallel and skips per-cell object
+        # materialization; fall back to the C engine without it.
+        try:
+            return pd.read_csv(path, engine="pyarrow", **kwargs)
+        except ImportError:
+            return pd.read_csv(path, **kwargs)
+
+    try:
+        df = read_csv(usecols=sorted(REQUIRED_COLUMNS), dtype=CSV_DTYPES)
+    except ValueError:
+        # Unexpected header or a value the strict dtypes can't hold —
+        # read everything untyped; the casts below still normalize and
+        # the check below reports anything missing.
+        df = read_csv()
+
+    df.columns = [c.strip().lower() for c in df.columns]
+
+    missing = REQUIRED_COLUMNS - set(df.columns)
+    if missing:
+        raise ValueError(f"Missing columns: {missing}")
+
+    # The build scripts emit ISO-8601 dates; naming the format takes
+    # the fast C parser path, and cache=True collapses the repeated
+    # dates (two rows per match) to one parse each.
+    df["date"] = pd.to_datetime(df["date"], format="ISO8601", cache=True)
+    df["year"] = pd.to_numeric(df["year"], errors="coerce")
+
+    # Downcast: scores and margins fit comfortably in int16, and the
+    # Elo/dominance columns lose nothing meaningful in float32. Halves
+    # the bytes every mask and groupby below has to scan.
+    for c in ("team_score", "opponent_score", "margin"):
+        df[c] = pd.to_numeric(df[c], errors="coerce").fillna(0).astype(np.int16)
+    for c in ("elo_pre", "elo_post", "elo_delta", "dominance_score"):
+        df[c] = df[c].astype(np.float32)
+
+    # Branchless result: sign(margin) + 1 is the category code directly
+    # (Loss=0, Draw=1, Win=2), matching how the dataset build derives
+    # the column — no string comparisons or object intermediates. The
+    # indicator columns fall out of int8 compares on the same codes and
+    # let every win/loss tally downstream use the Cython groupby-sum
+    # kernel.
+    result_codes = (np.sign(df["margin"].to_numpy()) + 1).astype(np.int8)
+    df["result"] = pd.Categorical.from_codes(
+        result_codes, categories=["Loss", "Draw", "Win"]
+    )
+    df["is_win"] = (result_codes == 2).astype(np.int8)
+    df["is_loss"] = (result_codes == 0).astype(np.int8)
+    df["is_draw"] = (result_codes == 1).astype(np.int8)
+
+    # Category dtype: equality filters and groupbys then compare int8
+    # codes instead of Python strings. team/opponent share one dtype so
+    # their codes stay comparable.
+    team_dtype = pd.CategoricalDtype(
+        sorted(set(df["team"].dropna()) | set(df["opponent"].dropna()))
+    )
+    df["team"] = df["team"].astype(team_dtype)
+    df["opponent"] = df["opponent"].astype(team_dtype)
+    df["tournament"] = df["tournament"].astype("category")
+
+    # Unordered fixture key: packing the sorted (team, opponent) codes
+    # into one int32 lets head-to-head filtering use a single equality
+    # test instead of four boolean masks.
+    tc = df["team"].cat.codes.to_numpy().astype(np.int32)
+    oc = df["opponent"].cat.codes.to_numpy().astype(np.int32)
+    df["pair_key"] = (np.minimum(tc, oc) << 16) | np.maximum(tc, oc)
+
+    # Format dates once at load; strftime is per-element Python and
+    # dates repeat (two rows per match), so store as category.
+    df["date_str"] = df["date"].dt.strftime("%Y-%m-%d").astype("category")
+
+    # The era filter drops any unparseable years, so the column can
+    # settle into a plain int16 instead of the masked Int64 extension
+    # dtype (8 bytes + validity mask per row).
+    df = df[df["year"] >= MIN_YEAR].copy()
+    df["year"] = df["year"].astype(np.int16)
+
+    # Sort once here; every slice downstream inherits date order, so
+    # the per-rerun sorts become no-ops. mergesort keeps ties stable.
+    df = df.sort_values("date", kind="mergesort").reset_index(drop=True)
+
+    try:
+        df.to_parquet(snapshot, index=False)
+    except (ImportError, OSError):
+        pass
+
+    return df
+
+df = load_data()
+
+
+@st.cache_data
+def wc_finals():
+    """Static finals list as a DataFrame, built once on first view."""
+    return pd.DataFrame(WORLD_CUPS, columns=WORLD_CUP_COLUMNS)
+
+
+@st.cache_data
+def wc_titles():
+    """Title counts from the static World Cup list, computed once.
+
+    value_counts is faster than groupby+size for this pattern, and the
+    list never changes within a session.
+    """
+    titles = (
+        wc_finals()["winner"]
+        .value_counts()
+        .rename_axis("Nation")
+        .reset_index(name="Titles")
+    )
+    return titles.sort_values(["Titles", "Nation"], ascending=[False, True])
+
+
+@st.cache_data
+def head_to_head(team_a, team_b, filter_key):
+    """All rows for fixtures between two teams, via the pair key.
+
+    Cached per (pair, filter settings) with df_filtered read from
+    module scope, so revisiting a matchup skips even the single-integer
+    pair_key scan. The result is a view — nothing downstream mutates it.
+    """
+    cats = df_filtered["team"].cat.categories
+    if team_a not in cats or team_b not in cats:
+        return df_filtered.iloc[0:0]
+    ca = cats.get_loc(team_a)
+    cb = cats.get_loc(team_b)
+    key = (min(ca, cb) << 16) | max(ca, cb)
+    return df_filtered[df_filtered["pair_key"].to_numpy() == key]
+
+
+@st.cache_data
+def teams_present(df):
+    """Teams with at least one row in this frame, for short-circuits.
+
+    Opponent-only nations sit in the shared categories but have no
+    team rows; checking membership here skips a full scan (and an
+    empty chart pipeline) for those selections.
+    """
+    return frozenset(df["team"].unique())
+
+
+@st.cache_data
+def team_frame(team, filter_key):
+    """One team's rows under the active sidebar filters.
+
+    Keyed by the team name plus the filter settings; df_filtered itself
+    is read from module scope, so the cache lookup hashes two small
+    values instead of the whole frame. The slice is an int8 categorical
+    comparison on a cache miss.
+    """
+    return df_filtered[df_filtered["team"] == team]
+
+
+METRIC_LABELS = (
+    "Matches", "Dominance", "Wins", "Losses", "Draws",
+    "Win %", "Avg Margin", "Avg Points For", "Avg Points Against",
+)
+
+
+def metrics_table(team_a, team_b):
+    """Side-by-side Compare table on a fixed schema.
+
+    The labels are a module-level tuple and each value column is a
+    prebuilt object array, so the DataFrame constructor skips per-cell
+    dtype inference; copy=False reuses the arrays as the columns.
+    """
+    def column(row):
+        # Preformatted strings keep each column a homogeneous Arrow
+        # string array (mixed int/str objects would force a repair pass).
+        vals = np.empty(len(METRIC_LABELS), dtype=object)
+        vals[0] = f"{int(row['matches'])}"
+        vals[1] = f"{int(row['dominance'])}"
+        vals[2] = f"{int(row['wins'])}"
+        vals[3] = f"{int(row['losses'])}"
+        vals[4] = f"{int(row['draws'])}"
+        vals[5] = f"{row['win_pct']:.1f}%"
+        vals[6] = f"{row['avg_margin']:.2f}"
+        vals[7] = f"{row['points_for']:.1f}"
+        vals[8] = f"{row['points_against']:.1f}"
+        return vals
+
+    return pd.DataFrame(
+        {
+            "Metric": METRIC_LABELS,
+            team_a: column(team_agg.loc[team_a]),
+            team_b: column(team_agg.loc[team_b]),
+        },
+        copy=False,
+    )
+
+
+class Summary(NamedTuple):
+    """Fixed-shape result of team_summary; attribute access beats a
+    dict hash per metric read in the Compare tab."""
+    matches: int
+    wins: int
+    losses: int
+    draws: int
+    win_pct: float
+    points_for: float
+    points_against: float
+    avg_margin: float
+    dominance: float
+
+
+EMPTY_SUMMARY = Summary(0, 0, 0, 0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def team_summary(tdf):
+    """Every summary metric from three fused passes over the arrays.
+
+    Two bincounts on the result codes (one plain, one margin-weighted)
+    plus a single score mean replace a separate pandas reduction per
+    metric; the rest follows from identities between the columns.
+    """
+    n = len(tdf)
+    if n == 0:
+        return EMPTY_SUMMARY
+
+    codes = tdf["result"].cat.codes.to_numpy()
+    margin = tdf["margin"].to_numpy()
+
+    # Two bincounts over the codes cover every result-dependent metric:
+    # the plain one yields the W/L/D record, and the margin-weighted one
+    # yields per-result margin sums, from which dominance (win margins
+    # minus loss margins) and the overall margin sum both fall out.
+    # load_data() pins the categories to Loss/Draw/Win, so the codes are
+    # 0/1/2 by construction and the counts unpack positionally — no
+    # label lookup per metric.
+    counts = np.bincount(codes, minlength=3)
+    margin_sums = np.bincount(codes, weights=margin, minlength=3)
+    losses, draws, wins = (int(c) for c in counts)
+
+    # points_against = points_for - avg_margin, so the opponent_score
+    # column never needs to be read.
+    points_for = tdf["team_score"].to_numpy().mean()
+    avg_margin = margin_sums.sum() / n
+
+    return Summary(
+        matches=n,
+        wins=wins,
+        losses=losses,
+        draws=draws,
+        win_pct=wins / n * 100,
+        points_for=points_for,
+        points_against=points_for - avg_margin,
+        avg_margin=avg_margin,
+        dominance=float(margin_sums[2] - margin_sums[0]),
+    )
+
+
+@st.cache_data
+def elo_timelines(df):
+    """Pre-split each team's (dates, elo) arrays for the Elo chart."""
+    if not df["date"].is_monotonic_increasing:
+        df = df.sort_values("date", kind="mergesort")
+    out = {}
+    for t, g in df.groupby("team", sort=False, observed=True):
+        out[t] = (g["date"].to_numpy(), g["elo_post"].to_numpy())
+    return out
+
+@st.cache_data
+def tournament_options(df):
+    """Sorted tournament names for the sidebar, computed once."""
+    return tuple(sorted(str(t) for t in df["tournament"].cat.categories))
+
+
+# =========================================================
+# Sidebar Filters
+# =========================================================
+with st.sidebar:
+    st.header("Filters")
+
+    year_range = st.slider(
+        "Year range",
+        int(df["year"].min()),
+        int(df["year"].max()),
+        (int(df["year"].min()), int(df["year"].max())),
+    )
+
+    selected_tournaments = st.multiselect(
+        "Tournaments",
+        tournament_options(df),
+        default=[]
+    )
+
+# Read-only slice: everything downstream aggregates or re-slices, so a
+# defensive copy would just duplicate the columns every rerun.
+df_filtered = df[
+    (df["year"] >= year_range[0]) &
+    (df["year"] <= year_range[1])
+]
+
+if selected_tournaments:
+    df_filtered = df_filtered[
+        df_filtered["tournament"].astype(str).isin(selected_tournaments)
+    ]
+
+# Hashable stand-in for df_filtered in per-team cache keys.
+filter_key = (year_range, tuple(selected_tournaments))
+
+# The shared team/opponent dtype already holds the sorted union of both
+# columns, so the selector options are an O(K) read of the categories —
+# cheaper than a @st.cache_data lookup, which would hash the whole
+# frame just to find the cached tuple.
+teams = tuple(df["team"].cat.categories)
+
+# =========================================================
+# Shared Aggregations
+# =========================================================
+@st.cache_data
+def team_aggregates(df):
+    """Fused per-team aggregation feeding Rankings, Compare and Elo.
+
+    One groupby pass instead of one per table, cached so widget
+    interactions that don't change the filters recompute nothing.
+    """
+    if not df["date"].is_monotonic_increasing:
+        df = df.sort_values("date", kind="mergesort")
+    agg = (
+        df
+        .groupby("team", as_index=False, observed=True, sort=False)
+        .agg(
+            dominance=("dominance_score", "sum"),
+            matches=("dominance_score", "count"),
+            avg_margin=("margin", "mean"),
+            wins=("is_win", "sum"),
+            losses=("is_loss", "sum"),
+            draws=("is_draw", "sum"),
+            points_for=("team_score", "mean"),
+            points_against=("opponent_score", "mean"),
+            current_elo=("elo_post", "last"),
+            peak_elo=("elo_post", "max"),
+        )
+    )
+    agg["win_pct"] = agg["wins"] / agg["matches"] * 100
+    # Indexed by team (column kept) so tabs can read one team's stats
+    # as a plain .loc lookup.
+    return agg.set_index("team", drop=False)
+
+
+@st.cache_data
+def opponent_record(team, filter_key):
+    """Win % against each opponent, twelve most-played first.
+
+    One crosstab pivot gives the result counts per opponent; the
+    reindex pins the Win/Loss/Draw columns even if a result never
+    occurs, and argpartition picks the top twelve in O(N) before the
+    small display sort.
+    """
+    tdf = team_frame(team, filter_key)
+    ct = pd.crosstab(tdf["opponent"], tdf["result"]).reindex(
+        columns=["Win", "Loss", "Draw"], fill_value=0
+    )
+    matches = ct.sum(axis=1).to_numpy()
+    played = matches > 0
+    ct = ct[played]
+    matches = matches[played]
+
+    k = min(12, len(matches))
+    if k == 0:
+        return pd.DataFrame(columns=["opponent", "matches", "win_pct"])
+    top = np.argpartition(-matches, k - 1)[:k]
+
+    return (
+        pd.DataFrame(
+            {
+                "opponent": ct.index[top],
+                "matches": matches[top],
+                "win_pct": ct["Win"].to_numpy()[top] / matches[top] * 100,
+            }
+        )
+        .sort_values("matches", ascending=False)
+        .reset_index(drop=True)
+    )
+
+
+@st.cache_data
+def yearly_stats(team, filter_key):
+    """One team's yearly stats, shared by Team View and Trends.
+
+    A single groupby over the cached team slice carries every yearly
+    series both tabs plot, keyed like team_frame so the cache lookup
+    never hashes a frame.
+    """
+    g = (
+        team_frame(team, filter_key)
+        .groupby("year", observed=True, sort=True)
+        .agg(
+            matches=("is_win", "size"),
+            wins=("is_win", "sum"),
+            dominance=("dominance_score", "sum"),
+            avg_margin=("margin", "mean"),
+        )
+    )
+    g["win_pct"] = g["wins"] / g["matches"] * 100
+    return g
+
+
+team_agg = team_aggregates(df_filtered)
+
+dominance_by_team = team_agg.sort_values("dominance", ascending=False)
+
+# =========================================================
+# Tabs
+# =========================================================
+tab_team, tab_rankings, tab_elo, tab_trends, tab_compare, tab_wc, tab_about = st.tabs(
+    ["Team View", "Rankings", "Elo", "Trends", "Compare", "World Cups", "About"]
+)
+
+# =========================================================
+# Team View
+# =========================================================
+# Each tab body is a fragment: a widget change inside one tab reruns
+# only that tab instead of re-executing every other tab's render path.
+@st.fragment
+def render_team_view():
+    st.header("Team Performance Overview")
+
+    team = st.selectbox("Select team", teams, key="team_view")
+
+    if team not in teams_present(df_filtered):
+        st.info("No matches for this team in the current filters.")
+        return
+
+    # All headline metrics come from one row of the cached fused
+    # aggregation — no per-rerun pass over the team's matches.
+    stats = team_agg.loc[team]
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Matches", int(stats["matches"]))
+    col2.metric("Total Dominance", int(stats["dominance"]))
+    col3.metric("Avg Margin", round(stats["avg_margin"], 2))
+
+    col4, col5, col6 = st.columns(3)
+    col4.metric("Win %", round(stats["win_pct"], 1))
+    col5.metric("Avg Points For", round(stats["points_for"], 1))
+    col6.metric("Avg Points Against", round(stats["points_against"], 1))
+
+    st.subheader("Yearly Form")
+    # Both series ride in one chart element, so a rerun ships a single
+    # Arrow payload and the browser does one render pass instead of two.
+    st.line_chart(
+        yearly_stats(team, filter_key)[["win_pct", "avg_margin"]],
+        use_container_width=True,
+    )
+
+    tdf = team_frame(team, filter_key)
+
+    st.subheader("Recent Matches")
+    show_cols = [
+        "date_str", "team", "opponent",
+        "team_score", "opponent_score",
+        "margin", "result", "tournament",
+    ]
+    # load_data() already sorted by date, and every slice inherits that
+    # order — the last ten rows reversed ARE the latest matches, no
+    # per-rerun O(N log N) sort needed.
+    st.dataframe(
+        tdf.tail(10).iloc[::-1][show_cols],
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+# =========================================================
+# Rankings
+# =========================================================
+@st.fragment
+def render_rankings():
+    st.header("Dominance Rankings")
+
+    dom = team_agg["dominance"].to_numpy()
+    if len(dom):
+        # argpartition finds the top K in O(N); only those ten rows
+        # then need a real sort for the chart.
+        k = min(10, len(dom))
+        idx = np.argpartition(-dom, k - 1)[:k]
+        top10 = team_agg.iloc[idx].sort_values("dominance", ascending=False)
+
+        st.subheader("Top 10 by Dominance")
+        st.bar_chart(top10, x="team", y="dominance", use_container_width=True)
+
+    rankings = dominance_by_team.reset_index(drop=True)
+    rankings["rank"] = rankings.index + 1
+
+    st.dataframe(
+        rankings[["rank", "team", "dominance", "matches", "wins", "win_pct", "avg_margin"]],
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "win_pct": st.column_config.NumberColumn(format="%.1f"),
+            "avg_margin": st.column_config.NumberColumn(format="%.2f"),
+        },
+    )
+
+
+# =========================================================
+# Elo
+# =========================================================
+@st.fragment
+def render_elo():
+    st.header("Elo Ratings")
+
+    elo_leader = (
+        team_agg
+        .sort_values("current_elo", ascending=False)
+        .reset_index(drop=True)
+    )
+
+    elo_leader["rank"] = elo_leader.index + 1
+
+    st.subheader("Elo Leaderboard")
+    st.dataframe(
+        elo_leader[["rank", "team", "current_elo", "peak_elo", "matches"]],
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "current_elo": st.column_config.NumberColumn(format="%.1f"),
+            "peak_elo": st.column_config.NumberColumn(format="%.1f"),
+        },
+    )
+
+    st.divider()
+
+    team = st.selectbox("Select team", teams, key="elo_team")
+
+    dates, elo = elo_timelines(df).get(team, ((), ()))
+
+    st.subheader(f"{team} Elo Over Time")
+    st.line_chart(
+        pd.DataFrame({"Elo": elo}, index=pd.DatetimeIndex(dates, name="Date")),
+        use_container_width=True,
+    )
+
+
+# =========================================================
+# Trends
+# =========================================================
+@st.fragment
+def render_trends():
+    st.header("Dominance Over Time")
+
+    team = st.selectbox("Select team", teams, key="trend_team")
+
+    if team not in teams_present(df_filtered):
+        st.info("No matches for this team in the current filters.")
+        return
+
+    yearly = yearly_stats(team, filter_key)
+
+    st.subheader(f"{team} — Annual Dominance")
+    st.line_chart(yearly[["dominance"]], use_container_width=True)
+
+    st.subheader(f"{team} — Win % vs Opponents")
+    st.bar_chart(
+        opponent_record(team, filter_key),
+        x="opponent",
+        y="win_pct",
+        use_container_width=True,
+    )
+
+
+# =========================================================
+# Compare
+# =========================================================
+@st.fragment
+def render_compare():
+    st.header("Team Comparison")
+
+    selected = st.multiselect(
+        "Select exactly two teams",
+        teams,
+        default=teams[:2],
+        max_selections=2,
+    )
+
+    if len(selected) != 2:
+        st.info("Select two teams to compare.")
+        return
+
+    if any(t not in team_agg.index for t in selected):
+        st.info("No matches for one of these teams in the current filters.")
+        return
+
+    st.dataframe(
+        metrics_table(*selected),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+    st.subheader("Head-to-Head Record")
+    h2h = head_to_head(*selected, filter_key)
+    # The long-form layout stores both perspectives, so one team's
+    # rows are enough: B's wins are A's losses. One summary pass
+    # covers both sides — no rename/concat normalization needed.
+    h2h_a = h2h[h2h["team"] == selected[0]]
+    record = team_summary(h2h_a)
+
+    rec1, rec2, rec3 = st.columns(3)
+    rec1.metric(f"{selected[0]} Wins", record.wins)
+    rec2.metric("Draws", record.draws)
+    rec3.metric(f"{selected[1]} Wins", record.losses)
+
+    # B's side of the fixture is just the mirrored columns of A's rows
+    # (points_against = B's points for), so no swap pass is needed.
+    rec4, rec5, rec6 = st.columns(3)
+    rec4.metric(f"{selected[0]} Avg Points", round(record.points_for, 1))
+    rec5.metric("Matches", record.matches)
+    rec6.metric(f"{selected[1]} Avg Points", round(record.points_against, 1))
+
+    st.subheader("Head-to-Head Matches")
+    st.dataframe(
+        # Rows already arrive in date order; reversing the slice is all
+        # the "sort" the newest-first view needs.
+        h2h_a.iloc[::-1][[
+            "date_str", "team", "opponent",
+            "team_score", "opponent_score",
+            "result", "tournament",
+        ]],
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+# =========================================================
+# World Cups
+# =========================================================
+@st.fragment
+def render_world_cups():
+    st.header("World Cups")
+
+    st.subheader("Titles")
+    st.dataframe(
+        wc_titles(),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+    st.subheader("Finals")
+    st.dataframe(
+        wc_finals(),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+# =========================================================
+# About
+# =========================================================
+@st.fragment
+def render_about():
+    st.header("About This Project")
+
+    st.markdown(
+        """
+**Rugby Performance Analytics Dashboard**
+
+- Match-level dataset (1987+)
+- Dominance Index v1
+- Elo ratings (explanatory)
+- Tier 1 & 2 nations
+
+Built for clarity, not prediction.
+"""
+    )
+
+
+with tab_team:
+    render_team_view()
+with tab_rankings:
+    render_rankings()
+with tab_elo:
+    render_elo()
+with tab_trends:
+    render_trends()
+with tab_compare:
+    render_compare()
+with tab_wc:
+    render_world_cups()
+with tab_about:
+    render_about()